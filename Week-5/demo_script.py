@@ -7,9 +7,38 @@ Demonstration script for real-time emotion prediction from audio files.
 import os
 import sys
 import glob
+import multiprocessing as mp
 from emotion_predictor import EmotionPredictor
 
 
+# Per-process predictor used by demo_directory's worker pool
+_worker_predictor = None
+
+
+def _init_worker(model_path, scaler_path):
+    """Load the model once per worker process."""
+    global _worker_predictor
+    # Workers predict straight away, so a background warmup gains nothing,
+    # and results are cached by the parent, whose cache outlives the pool
+    _worker_predictor = EmotionPredictor(
+        model_path, scaler_path, verbose=False, warmup=False, cache_size=0
+    )
+
+
+def _predict_file(audio_path):
+    """
+    Predict a single file inside a worker process.
+    
+    Returns:
+        Tuple (audio_path, result, error) where result is the
+        (emotion, confidence, probabilities) tuple or None on failure
+    """
+    try:
+        return audio_path, _worker_predictor.predict(audio_path), None
+    except Exception as e:
+        return audio_path, None, e
+
+
 def print_header():
     """Print demo header."""
     print("=" * 70)
@@ -76,6 +105,9 @@ def demo_directory(predictor, directory):
     """
     Run demo on all .wav files in a directory.
     
+    Files are processed in parallel across CPU cores; results are printed
+    in completion order.
+    
     Args:
         predictor: EmotionPredictor instance
         directory: Path to directory containing audio files
@@ -88,9 +120,48 @@ def demo_directory(predictor, directory):
     
     print(f"📂 Found {len(wav_files)} audio file(s)\n")
     
-    for idx, audio_file in enumerate(wav_files, 1):
+    n_workers = min(os.cpu_count() or 1, len(wav_files))
+    
+    if n_workers == 1:
+        for idx, audio_file in enumerate(wav_files, 1):
+            print(f"\n[{idx}/{len(wav_files)}]", end=" ")
+            demo_single_file(predictor, audio_file)
+        return
+    
+    # Files seen earlier in this session are answered from the predictor's
+    # cache; only the rest are sent to the pool
+    pending = []
+    idx = 0
+    for audio_file in wav_files:
+        cached = predictor.cached_prediction(audio_file)
+        if cached is None:
+            pending.append(audio_file)
+            continue
+        idx += 1
         print(f"\n[{idx}/{len(wav_files)}]", end=" ")
-        demo_single_file(predictor, audio_file)
+        print_prediction_result(os.path.basename(audio_file), *cached)
+    
+    if not pending:
+        return
+    
+    # Forking while the warmup thread holds import locks would leave the
+    # workers deadlocked on their first librosa call
+    predictor.wait_until_ready()
+    
+    with mp.Pool(
+        processes=min(n_workers, len(pending)),
+        initializer=_init_worker,
+        initargs=(predictor.model_path, predictor.scaler_path)
+    ) as pool:
+        results = pool.imap_unordered(_predict_file, pending)
+        for audio_file, result, error in results:
+            idx += 1
+            print(f"\n[{idx}/{len(wav_files)}]", end=" ")
+            if error is not None:
+                print(f"❌ Error processing {audio_file}: {error}\n")
+            else:
+                predictor.store_prediction(audio_file, result)
+                print_prediction_result(os.path.basename(audio_file), *result)
 
 
 def interactive_mode(predictor):
@@ -8,10 +8,27 @@ and making predictions on new audio files.
 """
 
 import os
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
 import joblib
-import librosa
 import numpy as np
-from typing import Tuple, Optional, Dict
+import soundfile as sf
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Dict, Optional, Tuple, Union
+from fast_features import extract_features_nb, N_FEATURES
+from fast_svm import RBFSVC
+
+try:
+    import onnxruntime as ort
+except ImportError:  # Optional: fall back to sklearn inference
+    ort = None
+
+try:
+    import onnx
+except ImportError:  # Optional: ONNX metadata is then read from the session
+    onnx = None
 
 
 class EmotionPredictor:
@@ -25,13 +42,18 @@ class EmotionPredictor:
     Attributes:
         model: Trained sklearn classifier (SVM or RandomForest)
         scaler: Fitted StandardScaler for feature normalization
+        session: ONNX Runtime session for the model, if available
         emotion_map: Dictionary mapping emotion IDs to labels
     """
     
     def __init__(
         self,
         model_path: str = 'artifacts/svm_model.pkl',
-        scaler_path: str = 'artifacts/standard_scaler.pkl'
+        scaler_path: str = 'artifacts/standard_scaler.pkl',
+        verbose: bool = True,
+        onnx_path: Optional[str] = None,
+        cache_size: int = 1024,
+        warmup: bool = True
     ):
         """
         Initialize the predictor with trained model and scaler.
@@ -39,6 +61,14 @@ class EmotionPredictor:
         Args:
             model_path: Path to saved model (.pkl file)
             scaler_path: Path to saved scaler (.pkl file)
+            verbose: Print loading summary and warnings about stale exports
+            onnx_path: Path to the ONNX export of the model (default: model
+                path with .onnx extension). Used when onnxruntime is
+                installed and the file matches the model.
+            cache_size: Number of file predictions to memoize (0 disables)
+            warmup: Warm up the pipeline on a background thread. Call
+                wait_until_ready before forking so children do not inherit
+                import locks held by that thread.
             
         Raises:
             FileNotFoundError: If model or scaler files don't exist
@@ -48,12 +78,47 @@ class EmotionPredictor:
         if not os.path.exists(scaler_path):
             raise FileNotFoundError(f"Scaler not found at {scaler_path}")
         
-        self.model = joblib.load(model_path)
+        self.model_path = model_path
+        self.scaler_path = scaler_path
+        self.verbose = verbose
+        self.model, svc_arrays = self._load_model(model_path)
         self.scaler = joblib.load(scaler_path)
         
+        # Inference backend: float32 kernel for RBF SVMs, else ONNX Runtime
+        # when an export is available, else sklearn
+        self._svc = RBFSVC.from_model(self.model, svc_arrays)
+        self.session = None
+        if self._svc is None:
+            if onnx_path is None:
+                onnx_path = os.path.splitext(model_path)[0] + '.onnx'
+            self.session = self._load_onnx_session(onnx_path, model_path)
+        
         # Check expected feature count
         self.expected_features = self.scaler.n_features_in_
         
+        # The extractor always yields N_FEATURES values: decide once how to
+        # fit them to the scaler instead of checking on every clip
+        if self.expected_features == N_FEATURES:
+            self._fit_features = self._features_exact
+        elif N_FEATURES == 81 and self.expected_features in (82, 83):
+            self._feature_pad = np.zeros(
+                self.expected_features - N_FEATURES, dtype=np.float32
+            )
+            self._fit_features = self._features_padded
+        else:
+            self._fit_features = self._features_mismatch
+        
+        # float32 copies of the scaler statistics (see _scale)
+        self._scale_mean = np.zeros(self.expected_features, dtype=np.float32)
+        self._scale_inv = np.ones(self.expected_features, dtype=np.float32)
+        if getattr(self.scaler, 'mean_', None) is not None:
+            self._scale_mean[:] = self.scaler.mean_
+        if getattr(self.scaler, 'scale_', None) is not None:
+            self._scale_inv[:] = 1.0 / self.scaler.scale_
+        
+        # Per-thread (1, n_features) scratch buffer for single predictions
+        self._scratch = threading.local()
+        
         # RAVDESS emotion mapping
         self.emotion_map = {
             1: 'Neutral',
@@ -66,13 +131,32 @@ class EmotionPredictor:
             8: 'Surprised'
         }
         
-        print(f"✓ Model loaded from {model_path}")
-        print(f"✓ Scaler loaded from {scaler_path}")
-        print(f"✓ Expected features: {self.expected_features}")
+        # Predictions memoized by file identity (see _cache_key)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Import librosa, build filterbanks and load the compiled kernels in
+        # the background so the first prediction does not pay for them
+        self._warmup_thread = None
+        if warmup:
+            self._warmup_thread = threading.Thread(
+                target=self._warmup, daemon=True
+            )
+            self._warmup_thread.start()
+        
+        if verbose:
+            print(f"✓ Model loaded from {model_path}")
+            print(f"✓ Scaler loaded from {scaler_path}")
+            if self._svc is not None:
+                print("✓ Using float32 RBF kernel for SVM inference")
+            elif self.session is not None:
+                print(f"✓ ONNX Runtime session from {onnx_path}")
+            print(f"✓ Expected features: {self.expected_features}")
     
     def extract_features(
         self,
-        audio_path: str,
+        audio_path: Union[str, BinaryIO],
         sr: int = 22050,
         duration: float = 3.0
     ) -> np.ndarray:
@@ -82,7 +166,8 @@ class EmotionPredictor:
         This MUST match the exact feature extraction used in training.
         
         Args:
-            audio_path: Path to audio file (.wav)
+            audio_path: Path to audio file (.wav), or the file opened in
+                binary mode
             sr: Sampling rate (default: 22050 Hz)
             duration: Audio duration to load (default: 3.0 seconds)
             
@@ -93,78 +178,115 @@ class EmotionPredictor:
             FileNotFoundError: If audio file doesn't exist
             Exception: If feature extraction fails
         """
-        if not os.path.exists(audio_path):
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
-        
         try:
             # Load audio - EXACT same parameters as training
-            y, sr = librosa.load(
-                audio_path,
-                sr=sr,
-                mono=True,
-                duration=duration
-            )
-            
-            # MFCCs - EXACT same parameters
-            mfcc = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13)
+            y, sr = self._load(audio_path, sr=sr, duration=duration)
             
-            # Delta & Delta-Delta
-            delta_mfcc = librosa.feature.delta(mfcc)
-            delta2_mfcc = librosa.feature.delta(mfcc, order=2)
+            return self.extract_features_from_array(y, sr)
             
-            # Temporal aggregation
-            mfcc_mean = np.mean(mfcc, axis=1)
-            mfcc_std = np.std(mfcc, axis=1)
-            
-            delta_mean = np.mean(delta_mfcc, axis=1)
-            delta_std = np.std(delta_mfcc, axis=1)
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            raise Exception(f"Feature extraction failed: {str(e)}")
+    
+    def _load(
+        self,
+        audio_path: Union[str, BinaryIO],
+        sr: int = 22050,
+        duration: float = 3.0
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Load mono audio, equivalent to librosa.load(sr, mono, duration).
+        
+        Reads through soundfile directly, skipping librosa's loader
+        overhead; files libsndfile cannot decode (e.g. mp3/m4a) fall back
+        to librosa.load. The path is only checked for existence after a
+        failed open, so the common case costs no extra stat().
+        
+        Args:
+            audio_path: Path to audio file, or the file opened in binary
+                mode (read from the start)
+            sr: Target sampling rate
+            duration: Seconds of audio to read from the start
             
-            delta2_mean = np.mean(delta2_mfcc, axis=1)
-            delta2_std = np.std(delta2_mfcc, axis=1)
+        Returns:
+            Tuple (y, sr) with y as float32 mono signal
             
-            # Spectral features
-            spectral_centroid = np.mean(
-                librosa.feature.spectral_centroid(y=y, sr=sr)
-            )
-            spectral_rolloff = np.mean(
-                librosa.feature.spectral_rolloff(y=y, sr=sr)
-            )
-            zero_crossing_rate = np.mean(
-                librosa.feature.zero_crossing_rate(y)
-            )
+        Raises:
+            FileNotFoundError: If audio file doesn't exist
+        """
+        import librosa
+        
+        try:
+            with sf.SoundFile(audio_path) as f:
+                file_sr = f.samplerate
+                y = f.read(
+                    frames=int(duration * file_sr),
+                    dtype='float32',
+                    always_2d=False
+                )
+        except RuntimeError:
+            path = getattr(audio_path, 'name', audio_path)
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"Audio file not found: {path}")
+            return librosa.load(path, sr=sr, mono=True, duration=duration)
+        
+        if y.ndim > 1:
+            y = y.mean(axis=1)
+        if file_sr != sr:
+            y = librosa.resample(y, orig_sr=file_sr, target_sr=sr)
+        
+        return y, sr
+    
+    def extract_features_from_array(
+        self,
+        y: np.ndarray,
+        sr: int = 22050
+    ) -> np.ndarray:
+        """
+        Extract training features from an in-memory audio signal.
+        
+        Shared by file-based prediction and the live detector so both go
+        through the same compiled kernels.
+        
+        Args:
+            y: Mono audio signal
+            sr: Sampling rate of y (default: 22050 Hz)
             
-            # Combine all features - EXACT same order as training
-            features = np.hstack([
-                mfcc_mean, mfcc_std,
-                delta_mean, delta_std,
-                delta2_mean, delta2_std,
-                spectral_centroid,
-                spectral_rolloff,
-                zero_crossing_rate
-            ])
-            
-            # Debug: Check feature count and fix if needed
-            if len(features) != self.expected_features:
-                # Common issue: training included 'filename' column by mistake
-                if len(features) == 81 and self.expected_features == 82:
-                    # Training used iloc[:, :-3] which included filename
-                    # Add a dummy 0 for filename column
-                    features = np.hstack([features, [0.0]])
-                    
-                elif len(features) == 81 and self.expected_features == 83:
-                    # Pad with zeros for other mismatches
-                    features = np.hstack([features, np.zeros(2)])
-                    
-                else:
-                    print(f"\n⚠️  WARNING: Feature count mismatch!")
-                    print(f"   Expected: {self.expected_features}")
-                    print(f"   Got: {len(features)}")
-                    raise ValueError(f"Feature dimension mismatch: expected {self.expected_features}, got {len(features)}")
-            
-            return features
+        Returns:
+            Feature vector as 1D numpy array
             
-        except Exception as e:
-            raise Exception(f"Feature extraction failed: {str(e)}")
+        Raises:
+            ValueError: If the feature count cannot be matched to the scaler
+        """
+        self.wait_until_ready()
+        
+        # MFCCs, deltas and spectral features from a single STFT
+        features = extract_features_nb(y, sr)
+        
+        return self._fit_features(features)
+    
+    def _features_exact(self, features: np.ndarray) -> np.ndarray:
+        """Feature count already matches the scaler."""
+        return features
+    
+    def _features_padded(self, features: np.ndarray) -> np.ndarray:
+        """
+        Append the constant zero padding the scaler expects.
+        
+        Common issue: training included 'filename' column by mistake.
+        With 82 features training used iloc[:, :-3], which included
+        filename, so a dummy 0 stands in for that column; 83 is padded
+        with zeros for other mismatches.
+        """
+        return np.concatenate([features, self._feature_pad])
+    
+    def _features_mismatch(self, features: np.ndarray) -> np.ndarray:
+        """Feature count cannot be matched to the scaler."""
+        print(f"\n⚠️  WARNING: Feature count mismatch!")
+        print(f"   Expected: {self.expected_features}")
+        print(f"   Got: {len(features)}")
+        raise ValueError(f"Feature dimension mismatch: expected {self.expected_features}, got {len(features)}")
     
     def predict(
         self,
@@ -187,33 +309,51 @@ class EmotionPredictor:
             >>> emotion, conf, probs = predictor.predict('audio.wav')
             >>> print(f"Emotion: {emotion} ({conf:.2%})")
         """
-        # Extract features
-        features = self.extract_features(audio_path)
-        features = features.reshape(1, -1)
+        self.wait_until_ready()
         
-        # Normalize features
-        features_scaled = self.scaler.transform(features)
+        # One open serves both the cache key and decoding
+        with self._open_audio(audio_path) as f:
+            # Repeated files skip extraction entirely
+            key = self._cache_key(f)
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+            
+            # Extract features
+            features = self.extract_features(f)
         
-        # Predict
-        emotion_id = self.model.predict(features_scaled)[0]
-        emotion_label = self.emotion_map[emotion_id]
+        result = self.predict_from_features(features)
+        self._cache_put(key, result)
+        return result
+    
+    def predict_from_features(
+        self,
+        features: np.ndarray
+    ) -> Tuple[str, Optional[float], Dict[str, float]]:
+        """
+        Predict emotion from an extracted feature vector.
         
-        # Get probabilities if available
-        probabilities = {}
-        confidence = None
+        Shared by predict and the live detector.
         
-        if hasattr(self.model, 'predict_proba'):
-            probs = self.model.predict_proba(features_scaled)[0]
-            
-            # Map probabilities to emotion labels
-            for idx, prob in enumerate(probs):
-                emotion_id_mapped = self.model.classes_[idx]
-                emotion_name = self.emotion_map[emotion_id_mapped]
-                probabilities[emotion_name] = prob
+        Args:
+            features: Feature vector from extract_features or
+                extract_features_from_array
             
-            confidence = probabilities[emotion_label]
+        Returns:
+            Tuple (emotion_label, confidence, probabilities) as in predict
+        """
+        features = features.reshape(1, -1)
         
-        return emotion_label, confidence, probabilities
+        # Normalize features
+        features_scaled = self._scale(features)
+        
+        # Predict
+        emotion_ids, probs = self._classify(features_scaled)
+        
+        return self._format_prediction(
+            emotion_ids[0],
+            None if probs is None else probs[0]
+        )
     
     def predict_batch(
         self,
@@ -222,21 +362,418 @@ class EmotionPredictor:
         """
         Predict emotions for multiple audio files.
         
+        Features are extracted concurrently, then the whole batch is scaled
+        and classified with a single call to the scaler and the model.
+        
         Args:
             audio_paths: List of paths to audio files
             
         Returns:
             List of tuples (emotion, confidence, probabilities) for each file
         """
-        results = []
-        for path in audio_paths:
-            try:
-                result = self.predict(path)
-                results.append(result)
-            except Exception as e:
-                print(f"Error processing {path}: {e}")
-                results.append((None, None, {}))
+        self.wait_until_ready()
+        results = [(None, None, {}) for _ in audio_paths]
+        
+        # Cache look-up and feature extraction per file; extraction
+        # releases the GIL (FFT and numba kernels)
+        with ThreadPoolExecutor() as executor:
+            looked_up = list(executor.map(self._try_extract, audio_paths))
+        
+        keys = [key for key, _, _ in looked_up]
+        valid = []
+        for idx, (_, cached, features) in enumerate(looked_up):
+            if cached is not None:
+                results[idx] = cached
+            elif features is not None:
+                valid.append(idx)
+        if not valid:
+            return results
+        
+        # Normalize and predict the whole batch at once
+        features = np.vstack([looked_up[idx][2] for idx in valid])
+        features_scaled = self._scale(features)
+        
+        emotion_ids, all_probs = self._classify(features_scaled)
+        if all_probs is None:
+            all_probs = [None] * len(valid)
+        
+        for idx, emotion_id, probs in zip(valid, emotion_ids, all_probs):
+            results[idx] = self._format_prediction(emotion_id, probs)
+            self._cache_put(keys[idx], results[idx])
         return results
+    
+    def cached_prediction(
+        self,
+        audio_path: str
+    ) -> Optional[Tuple[str, Optional[float], Dict[str, float]]]:
+        """
+        Memoized result of predict(audio_path), if the file is unchanged.
+        
+        Args:
+            audio_path: Path to audio file
+            
+        Returns:
+            Tuple (emotion_label, confidence, probabilities) as in
+            predict, or None on a cache miss
+        """
+        try:
+            with self._open_audio(audio_path) as f:
+                return self._cache_get(self._cache_key(f))
+        except OSError:
+            return None
+    
+    def store_prediction(
+        self,
+        audio_path: str,
+        result: Tuple[str, Optional[float], Dict[str, float]]
+    ):
+        """
+        Memoize a prediction made elsewhere (e.g. in a worker process).
+        
+        Args:
+            audio_path: Path to audio file
+            result: Tuple (emotion_label, confidence, probabilities)
+        """
+        try:
+            with self._open_audio(audio_path) as f:
+                self._cache_put(self._cache_key(f), result)
+        except OSError:
+            pass
+    
+    def wait_until_ready(self):
+        """
+        Block until the background warmup has finished.
+        
+        Predictions call this themselves. Call it before forking worker
+        processes (e.g. multiprocessing.Pool): a child forked mid-warmup
+        inherits import locks held by the warmup thread and deadlocks on
+        its first librosa call.
+        """
+        thread = self._warmup_thread
+        if thread is not None:
+            thread.join()
+            self._warmup_thread = None
+    
+    def _open_audio(self, audio_path: str) -> BinaryIO:
+        """
+        Open an audio file for both the cache key and decoding.
+        
+        Unbuffered, so soundfile's reads go straight to the descriptor.
+        
+        Raises:
+            FileNotFoundError: If audio file doesn't exist
+        """
+        try:
+            return open(audio_path, 'rb', buffering=0)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+    
+    def _cache_key(self, f: BinaryIO) -> Optional[Tuple]:
+        """
+        Identify an open file by device, inode, mtime, size and a hash of
+        its first and last 4 KiB.
+        
+        Taken with fstat and two reads on the descriptor that is then
+        decoded (soundfile reads the header and first block next anyway),
+        so a cache miss adds no extra open or stat(). The hash covers the
+        WAV header and samples at both ends (recordings often begin with
+        identical silence), catching in-place rewrites that keep the size
+        on filesystems with coarse mtime (seconds on FAT and some network
+        mounts). A rewrite that changes only the middle of the file is
+        still served its old prediction.
+        
+        Returns:
+            Hashable key, or None if caching is disabled or the file
+            cannot be read (extraction then reports the error)
+        """
+        if self.cache_size <= 0:
+            return None
+        try:
+            stat = os.fstat(f.fileno())
+            digest = hashlib.blake2b(f.read(4096), digest_size=16)
+            if stat.st_size > 8192:
+                f.seek(-4096, os.SEEK_END)
+                digest.update(f.read(4096))
+            f.seek(0)
+        except OSError:
+            return None
+        return (
+            stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size,
+            digest.hexdigest()
+        )
+    
+    def _cache_get(self, key):
+        """Return a copy of a memoized prediction, or None."""
+        if key is None:
+            return None
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is None:
+                return None
+            self._cache.move_to_end(key)
+        emotion, confidence, probabilities = result
+        return emotion, confidence, dict(probabilities)
+    
+    def _cache_put(self, key, result):
+        """Memoize a prediction, evicting the least recently used."""
+        if key is None:
+            return
+        emotion, confidence, probabilities = result
+        with self._cache_lock:
+            self._cache[key] = (emotion, confidence, dict(probabilities))
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
+    def _warmup(self):
+        """
+        Run the full pipeline once on a silent clip.
+        
+        Mel filterbank and DCT basis are constant for a fixed sampling
+        rate; numba kernels are loaded from cache (or compiled) on first
+        call; librosa's resampler is imported lazily on first use.
+        """
+        try:
+            import librosa
+            
+            silence = np.zeros(int(22050 * 3.0), dtype=np.float32)
+            librosa.resample(silence[:4096], orig_sr=48000, target_sr=22050)
+            extract_features_nb(silence, 22050)
+            self._classify(np.zeros((1, self.expected_features)))
+        except Exception:
+            # Any real problem resurfaces on the first prediction
+            pass
+    
+    def _load_model(self, model_path: str):
+        """
+        Load the classifier, preferring the protocol-5 export.
+        
+        When export_pickle.py has written a ``.pkl5`` next to the model and
+        the model file is unchanged since (same size and mtime), it is
+        unpickled directly and its arrays are memory-mapped read-only from
+        the ``.npy`` files, so processes loading the same model share those
+        pages. Otherwise (or if the export is stale or incomplete) the
+        model is read with joblib.
+        
+        Args:
+            model_path: Path to saved model (.pkl file)
+            
+        Returns:
+            Tuple (model, svc_arrays): the fitted sklearn classifier and the
+            memory-mapped RBFSVC arrays, or None if they were not exported
+        """
+        base = os.path.splitext(model_path)[0]
+        pkl5_path = base + '.pkl5'
+        if not os.path.exists(pkl5_path):
+            return joblib.load(model_path), None
+        
+        with open(pkl5_path, 'rb') as f:
+            payload = pickle.load(f)
+        if not self._export_is_current(payload, model_path):
+            if self.verbose:
+                print(f"⚠️  {pkl5_path} does not match {model_path}; "
+                      f"re-run export_pickle.py. Loading with joblib.")
+            return joblib.load(model_path), None
+        
+        arrays = {}
+        try:
+            for name in payload['arrays']:
+                arrays[name] = np.load(f"{base}_{name}.npy", mmap_mode='r')
+        except (OSError, ValueError) as e:
+            if self.verbose:
+                print(f"⚠️  Incomplete export {pkl5_path} ({e}); "
+                      f"re-run export_pickle.py. Loading with joblib.")
+            return joblib.load(model_path), None
+        
+        model = payload['model']
+        if 'support_vectors' in arrays:
+            model.support_vectors_ = arrays.pop('support_vectors')
+        
+        svc_arrays = None
+        if all(name in arrays for name in RBFSVC.ARRAYS):
+            svc_arrays = arrays
+        return model, svc_arrays
+    
+    def _load_onnx_session(self, onnx_path: str, model_path: str):
+        """
+        Open an ONNX Runtime session for the exported model, if usable.
+        
+        The export is skipped when onnxruntime is missing, the file does
+        not exist, or it was exported from a different model file.
+        
+        Args:
+            onnx_path: Path to .onnx export (see export_onnx.py)
+            model_path: Path to the sklearn model it should match
+            
+        Returns:
+            InferenceSession or None
+        """
+        if ort is None or not os.path.exists(onnx_path):
+            return None
+        
+        with open(onnx_path, 'rb') as f:
+            onnx_bytes = f.read()
+        
+        # Check the export before paying for session creation when the
+        # onnx package can read its metadata
+        if onnx is not None:
+            metadata = {
+                prop.key: prop.value
+                for prop in onnx.load_from_string(onnx_bytes).metadata_props
+            }
+            if not self._export_is_current(metadata, model_path):
+                self._warn_stale_onnx(onnx_path, model_path)
+                return None
+        
+        # Single-threaded: per-sample latency, no thread pool wake-ups
+        sess_options = ort.SessionOptions()
+        sess_options.intra_op_num_threads = 1
+        session = ort.InferenceSession(
+            onnx_bytes,
+            sess_options,
+            providers=['CPUExecutionProvider']
+        )
+        
+        if onnx is None:
+            metadata = session.get_modelmeta().custom_metadata_map
+            if not self._export_is_current(metadata, model_path):
+                self._warn_stale_onnx(onnx_path, model_path)
+                return None
+        
+        return session
+    
+    def _warn_stale_onnx(self, onnx_path: str, model_path: str):
+        """Report an ONNX export that no longer matches its model."""
+        if self.verbose:
+            print(f"⚠️  {onnx_path} does not match {model_path}; "
+                  f"re-run export_onnx.py. Using sklearn inference.")
+    
+    @staticmethod
+    def _export_is_current(metadata, model_path: str) -> bool:
+        """
+        Whether an export's recorded source size and mtime (see
+        export_pickle.source_stamp) match the model file.
+        
+        Values are compared as strings, since ONNX metadata stores them so.
+        """
+        stat = os.stat(model_path)
+        return (
+            str(metadata.get('source_size')) == str(stat.st_size)
+            and str(metadata.get('source_mtime_ns')) == str(stat.st_mtime_ns)
+        )
+    
+    def _scale(self, features: np.ndarray) -> np.ndarray:
+        """
+        StandardScaler.transform, computed in float32.
+        
+        Single samples are scaled in place into a pre-allocated per-thread
+        buffer, so the live loop does not allocate here. The returned
+        buffer is overwritten by the next single-sample call on the same
+        thread.
+        
+        Args:
+            features: Raw features, shape (n_samples, n_features)
+            
+        Returns:
+            Scaled float32 features
+        """
+        if features.shape[0] != 1:
+            features = np.asarray(features, dtype=np.float32)
+            return (features - self._scale_mean) * self._scale_inv
+        
+        buf = getattr(self._scratch, 'features', None)
+        if buf is None:
+            buf = np.empty((1, self.expected_features), dtype=np.float32)
+            self._scratch.features = buf
+        
+        np.subtract(features, self._scale_mean, out=buf)
+        np.multiply(buf, self._scale_inv, out=buf)
+        return buf
+    
+    def _classify(
+        self,
+        features_scaled: np.ndarray
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Run the classifier on a batch of scaled feature vectors.
+        
+        Args:
+            features_scaled: Scaled features, shape (n_samples, n_features)
+            
+        Returns:
+            Tuple (emotion_ids, probs); probs is ordered as model.classes_
+            and None if the model has no predict_proba
+        """
+        if self._svc is not None:
+            return self._svc.predict_with_proba(features_scaled)
+        
+        has_proba = hasattr(self.model, 'predict_proba')
+        
+        if self.session is not None:
+            emotion_ids, probs = self.session.run(
+                ['label', 'probabilities'],
+                {'X': features_scaled.astype(np.float32)}
+            )
+            return emotion_ids, probs if has_proba else None
+        
+        emotion_ids = self.model.predict(features_scaled)
+        probs = None
+        if has_proba:
+            probs = self.model.predict_proba(features_scaled)
+        return emotion_ids, probs
+    
+    def _try_extract(
+        self,
+        audio_path: str
+    ) -> Tuple[Optional[Tuple], Optional[tuple], Optional[np.ndarray]]:
+        """
+        Cache look-up, then feature extraction, for one file of a batch.
+        
+        Returns:
+            Tuple (cache_key, cached_result, features); failures are
+            reported instead of raised and leave both results None
+        """
+        try:
+            with self._open_audio(audio_path) as f:
+                key = self._cache_key(f)
+                cached = self._cache_get(key)
+                if cached is not None:
+                    return key, cached, None
+                return key, None, self.extract_features(f)
+        except Exception as e:
+            print(f"Error processing {audio_path}: {e}")
+            return None, None, None
+    
+    def _format_prediction(
+        self,
+        emotion_id: int,
+        probs: Optional[np.ndarray]
+    ) -> Tuple[str, Optional[float], Dict[str, float]]:
+        """
+        Map a predicted class and its probability row to emotion labels.
+        
+        Args:
+            emotion_id: Predicted RAVDESS emotion ID
+            probs: Class probabilities ordered as model.classes_, or None
+            
+        Returns:
+            Tuple (emotion_label, confidence, probabilities)
+        """
+        emotion_label = self.emotion_map[emotion_id]
+        
+        probabilities = {}
+        confidence = None
+        
+        if probs is not None:
+            # Map probabilities to emotion labels
+            for idx, prob in enumerate(probs):
+                emotion_id_mapped = self.model.classes_[idx]
+                emotion_name = self.emotion_map[emotion_id_mapped]
+                probabilities[emotion_name] = prob
+            
+            confidence = probabilities[emotion_label]
+        
+        return emotion_label, confidence, probabilities
 
 
 if __name__ == "__main__":
@@ -0,0 +1,62 @@
+"""
+ONNX Export
+===========
+Convert the trained classifier to ONNX for faster inference.
+
+EmotionPredictor uses the exported model through ONNX Runtime when it is
+installed and the .onnx file sits next to the .pkl model.
+
+Requirements:
+    pip install skl2onnx onnxruntime
+
+Usage:
+    python export_onnx.py [model_path] [scaler_path]
+"""
+
+import os
+import sys
+import joblib
+from skl2onnx import convert_sklearn
+from skl2onnx.common.data_types import FloatTensorType
+from export_pickle import source_stamp
+
+
+def export_onnx(
+    model_path='artifacts/svm_model.pkl',
+    scaler_path='artifacts/standard_scaler.pkl'
+):
+    """
+    Export a saved sklearn classifier to ONNX.
+
+    Args:
+        model_path: Path to saved model (.pkl file)
+        scaler_path: Path to saved scaler (.pkl file), used for input width
+
+    Returns:
+        Path of the written .onnx file
+    """
+    model = joblib.load(model_path)
+    n_features = joblib.load(scaler_path).n_features_in_
+
+    onnx_model = convert_sklearn(
+        model,
+        initial_types=[('X', FloatTensorType([None, n_features]))],
+        options={id(model): {'zipmap': False}}
+    )
+
+    # Record the source model so stale exports are detected at load time
+    for key, value in source_stamp(model_path).items():
+        meta = onnx_model.metadata_props.add()
+        meta.key = key
+        meta.value = str(value)
+
+    onnx_path = os.path.splitext(model_path)[0] + '.onnx'
+    with open(onnx_path, 'wb') as f:
+        f.write(onnx_model.SerializeToString())
+
+    return onnx_path
+
+
+if __name__ == "__main__":
+    onnx_path = export_onnx(*sys.argv[1:3])
+    print(f"✓ ONNX model written to {onnx_path}")
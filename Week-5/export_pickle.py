@@ -0,0 +1,73 @@
+"""
+Pickle Export
+=============
+Re-save the trained classifier for fast loading.
+
+The model is written with pickle protocol 5 to ``<model>.pkl5``, with its
+large arrays stored beside it as ``<model>_<name>.npy``: the support
+vectors and, for RBF SVMs, the float32 matrices used by fast_svm.RBFSVC.
+EmotionPredictor memory-maps these files, so worker processes share the
+same pages instead of each holding a copy.
+
+Usage:
+    python export_pickle.py [model_path]
+"""
+
+import os
+import pickle
+import sys
+import joblib
+import numpy as np
+from fast_svm import RBFSVC
+
+
+def source_stamp(path):
+    """Size and mtime of a file; ties an export to its source model."""
+    stat = os.stat(path)
+    return {'source_size': stat.st_size, 'source_mtime_ns': stat.st_mtime_ns}
+
+
+def export_pickle(model_path='artifacts/svm_model.pkl'):
+    """
+    Export a saved sklearn classifier as protocol-5 pickle (+ .npy files).
+
+    Args:
+        model_path: Path to saved model (.pkl file)
+
+    Returns:
+        Path of the written .pkl5 file
+    """
+    model = joblib.load(model_path)
+    base = os.path.splitext(model_path)[0]
+
+    arrays = {}
+    svc = RBFSVC.from_model(model)
+    if svc is not None:
+        for name in RBFSVC.ARRAYS:
+            arrays[name] = getattr(svc, name)
+
+    # Detach the support vectors so they can be memory-mapped at load time
+    if getattr(model, 'support_vectors_', None) is not None:
+        arrays['support_vectors'] = model.support_vectors_
+        model.support_vectors_ = None
+
+    for name, arr in arrays.items():
+        np.save(f"{base}_{name}.npy", np.ascontiguousarray(arr))
+
+    # Record the source model so stale exports are detected at load time
+    payload = dict(
+        source_stamp(model_path),
+        arrays=sorted(arrays),
+        model=model
+    )
+
+    pkl5_path = base + '.pkl5'
+    with open(pkl5_path, 'wb') as f:
+        pickle.dump(payload, f, protocol=5)
+
+    return pkl5_path
+
+
+if __name__ == "__main__":
+    pkl5_path = export_pickle(*sys.argv[1:2])
+    print(f"✓ Pickle export written to {pkl5_path}")
@@ -0,0 +1,362 @@
+"""
+Fast Feature Extraction
+=======================
+Numba-compiled implementation of the training feature pipeline.
+
+This module reproduces the 81-dimensional feature vector used during
+training (13 MFCCs, deltas and delta-deltas aggregated by mean/std, plus
+spectral centroid, spectral roll-off and zero-crossing rate) without going
+through librosa's per-call dispatch. All spectral features are derived
+from a single STFT of the input signal.
+
+Spectrograms and intermediate matrices are stored as float32 (halving the
+bytes moved per frame); running sums are accumulated in float64.
+"""
+
+import functools
+from typing import NamedTuple
+
+import numpy as np
+import scipy.fft
+import scipy.signal
+from numba import njit
+
+
+# Training parameters (librosa defaults) - MUST match training EXACTLY
+N_FFT = 2048
+HOP_LENGTH = 512
+N_MELS = 128
+N_MFCC = 13
+DELTA_WIDTH = 9
+ROLL_PERCENT = 0.85
+ZCR_THRESHOLD = 1e-10
+AMIN = 1e-10
+TOP_DB = 80.0
+
+N_FEATURES = 6 * N_MFCC + 3
+
+
+class FeatureBases(NamedTuple):
+    """Constant analysis matrices for one sampling rate."""
+    window: np.ndarray
+    mel_basis: np.ndarray
+    band_lo: np.ndarray
+    band_hi: np.ndarray
+    dct_basis: np.ndarray
+    freqs: np.ndarray
+
+
+@functools.lru_cache(maxsize=None)
+def feature_bases(sr: int) -> FeatureBases:
+    """
+    Build (once per sampling rate) the window, mel filterbank and DCT basis.
+
+    Args:
+        sr: Sampling rate (Hz)
+
+    Returns:
+        FeatureBases for sr
+    """
+    import librosa
+
+    window = scipy.signal.get_window('hann', N_FFT).astype(np.float32)
+
+    mel_basis = librosa.filters.mel(sr=sr, n_fft=N_FFT, n_mels=N_MELS)
+    nonzero = mel_basis > 0
+    band_lo = nonzero.argmax(axis=1)
+    band_hi = np.where(
+        nonzero.any(axis=1),
+        mel_basis.shape[1] - nonzero[:, ::-1].argmax(axis=1),
+        band_lo
+    )
+
+    dct_basis = scipy.fft.dct(
+        np.eye(N_MELS), type=2, norm='ortho', axis=0
+    )[:N_MFCC].astype(np.float32)
+    freqs = np.fft.rfftfreq(N_FFT, d=1.0 / sr).astype(np.float32)
+
+    for arr in (window, mel_basis, band_lo, band_hi, dct_basis, freqs):
+        arr.flags.writeable = False
+
+    return FeatureBases(window, mel_basis, band_lo, band_hi, dct_basis, freqs)
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _spectral_frames(mag, mel_basis, band_lo, band_hi, freqs):
+    """
+    Single pass over the magnitude spectrogram.
+
+    Each frame is read once while it is hot in cache: it is accumulated
+    for centroid and roll-off and squared on the fly for the mel
+    projection, so no separate power spectrogram is materialized.
+
+    Args:
+        mag: Magnitude spectrogram, shape (n_frames, n_bins)
+        mel_basis: Mel filterbank, shape (n_mels, n_bins)
+        band_lo: First non-zero bin of each mel filter
+        band_hi: One past the last non-zero bin of each mel filter
+        freqs: Centre frequency of each bin (Hz)
+
+    Returns:
+        Tuple of (log-mel spectrogram in dB, shape (n_frames, n_mels),
+        mean centroid, mean roll-off)
+    """
+    n_frames, n_bins = mag.shape
+    n_mels = mel_basis.shape[0]
+    tiny = np.finfo(np.float32).tiny
+
+    log_mel = np.empty((n_frames, n_mels), dtype=np.float32)
+    centroid_sum = 0.0
+    rolloff_sum = 0.0
+    for t in range(n_frames):
+        frame = mag[t]
+
+        total = 0.0
+        weighted = 0.0
+        for f in range(n_bins):
+            total += frame[f]
+            weighted += freqs[f] * frame[f]
+
+        # librosa leaves near-silent frames unnormalized
+        if total >= tiny:
+            centroid_sum += weighted / total
+        else:
+            centroid_sum += weighted
+
+        threshold = ROLL_PERCENT * total
+        cumulative = 0.0
+        for f in range(n_bins):
+            cumulative += frame[f]
+            if cumulative >= threshold:
+                rolloff_sum += freqs[f]
+                break
+
+        # Mel power spectrum in dB (ref=1.0), visiting non-zero bins only
+        for m in range(n_mels):
+            acc = 0.0
+            for f in range(band_lo[m], band_hi[m]):
+                acc += mel_basis[m, f] * frame[f] * frame[f]
+            log_mel[t, m] = 10.0 * np.log10(max(acc, AMIN))
+
+    return log_mel, centroid_sum / n_frames, rolloff_sum / n_frames
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _mfcc(log_mel, dct_basis):
+    """
+    top_db clipping and DCT, matching librosa.feature.mfcc.
+
+    Args:
+        log_mel: Log-mel spectrogram in dB, shape (n_frames, n_mels)
+        dct_basis: Orthonormal DCT-II basis, shape (n_mfcc, n_mels)
+
+    Returns:
+        MFCC matrix, shape (n_mfcc, n_frames)
+    """
+    n_frames, n_mels = log_mel.shape
+    n_mfcc = dct_basis.shape[0]
+
+    floor = log_mel.max() - TOP_DB
+    for t in range(n_frames):
+        for m in range(n_mels):
+            if log_mel[t, m] < floor:
+                log_mel[t, m] = floor
+
+    mfcc = np.empty((n_mfcc, n_frames), dtype=np.float32)
+    for k in range(n_mfcc):
+        for t in range(n_frames):
+            acc = 0.0
+            for m in range(n_mels):
+                acc += dct_basis[k, m] * log_mel[t, m]
+            mfcc[k, t] = acc
+    return mfcc
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _delta(x, order):
+    """
+    Savitzky-Golay derivative along frames (librosa.feature.delta, width=9).
+
+    With ``mode='interp'`` the polynomial fitted to each edge window has a
+    constant derivative of the requested order, so edge frames repeat the
+    first/last interior value.
+
+    Args:
+        x: Input matrix, shape (n_rows, n_frames)
+        order: Derivative order (1 or 2)
+
+    Returns:
+        Derivative matrix, same shape as x
+    """
+    n_rows, n_frames = x.shape
+    half = DELTA_WIDTH // 2
+
+    coeffs = np.empty(DELTA_WIDTH)
+    if order == 1:
+        norm = 0.0
+        for k in range(-half, half + 1):
+            norm += k * k
+        for k in range(-half, half + 1):
+            coeffs[k + half] = k / norm
+    else:
+        mean_sq = 0.0
+        for k in range(-half, half + 1):
+            mean_sq += k * k
+        mean_sq /= DELTA_WIDTH
+        norm = 0.0
+        for k in range(-half, half + 1):
+            norm += (k * k - mean_sq) ** 2
+        for k in range(-half, half + 1):
+            coeffs[k + half] = 2.0 * (k * k - mean_sq) / norm
+
+    out = np.empty((n_rows, n_frames), dtype=np.float32)
+    for r in range(n_rows):
+        for t in range(half, n_frames - half):
+            acc = 0.0
+            for k in range(DELTA_WIDTH):
+                acc += coeffs[k] * x[r, t - half + k]
+            out[r, t] = acc
+        for t in range(half):
+            out[r, t] = out[r, half]
+            out[r, n_frames - 1 - t] = out[r, n_frames - 1 - half]
+    return out
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _zero_crossing_rate(y):
+    """
+    Mean zero-crossing rate over centred, edge-padded frames.
+
+    Sign changes are counted once over the signal, branch-free (XOR of
+    adjacent sign flags), into a prefix sum; each frame's count is then a
+    difference of two prefix entries instead of a rescan of its samples.
+    Edge padding repeats the end samples, so it never adds crossings.
+
+    Args:
+        y: Audio signal
+
+    Returns:
+        Mean fraction of sign changes per frame
+    """
+    n = y.shape[0]
+    pad = N_FFT // 2
+    n_frames = 1 + n // HOP_LENGTH
+
+    # crossings[i]: sign changes between consecutive samples up to index i
+    # (values within the threshold count as positive, like librosa)
+    crossings = np.empty(n, dtype=np.int64)
+    crossings[0] = 0
+    prev_neg = np.int64(y[0] < -ZCR_THRESHOLD)
+    for i in range(1, n):
+        neg = np.int64(y[i] < -ZCR_THRESHOLD)
+        crossings[i] = crossings[i - 1] + (neg ^ prev_neg)
+        prev_neg = neg
+
+    total = 0
+    for t in range(n_frames):
+        # Frame covers samples start..start + N_FFT - 1 (before clamping)
+        start = t * HOP_LENGTH - pad
+        lo = min(max(start, 0), n - 1)
+        hi = min(max(start + N_FFT - 1, 0), n - 1)
+        total += crossings[hi] - crossings[lo]
+    return total / (N_FFT * n_frames)
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def row_mean_std(M):
+    """
+    Per-row mean and (population) standard deviation in a single pass.
+
+    Sum and sum of squares are accumulated together, so each row is read
+    once. A serial loop is used: with 13 rows, thread start-up under
+    ``parallel=True`` costs more than the reduction itself.
+
+    Args:
+        M: Input matrix, shape (n_rows, n_cols)
+
+    Returns:
+        Tuple of (mean, std), each of shape (n_rows,)
+    """
+    n_rows, n_cols = M.shape
+    mean = np.empty(n_rows)
+    std = np.empty(n_rows)
+    for r in range(n_rows):
+        s = 0.0
+        s2 = 0.0
+        for c in range(n_cols):
+            # Widen before squaring: float32 squares lose the variance
+            value = np.float64(M[r, c])
+            s += value
+            s2 += value * value
+        m = s / n_cols
+        mean[r] = m
+        std[r] = np.sqrt(max(s2 / n_cols - m * m, 0.0))
+    return mean, std
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _aggregate(mfcc, delta_mfcc, delta2_mfcc, centroid, rolloff, zcr):
+    """
+    Temporal mean/std of each matrix, concatenated in training order.
+    """
+    n_mfcc = mfcc.shape[0]
+    out = np.empty(6 * n_mfcc + 3, dtype=np.float32)
+
+    pos = 0
+    for M in (mfcc, delta_mfcc, delta2_mfcc):
+        mean, std = row_mean_std(M)
+        out[pos:pos + n_mfcc] = mean
+        out[pos + n_mfcc:pos + 2 * n_mfcc] = std
+        pos += 2 * n_mfcc
+
+    out[pos] = centroid
+    out[pos + 1] = rolloff
+    out[pos + 2] = zcr
+    return out
+
+
+def extract_features_nb(y: np.ndarray, sr: int) -> np.ndarray:
+    """
+    Extract the training feature vector from a raw audio buffer.
+
+    Equivalent to the librosa pipeline used in training, but computes the
+    STFT once and shares it between MFCC, centroid and roll-off. The
+    filterbank and DCT basis come from the per-rate feature_bases cache.
+
+    Args:
+        y: Mono audio signal (float32)
+        sr: Sampling rate of y
+
+    Returns:
+        Feature vector of length N_FEATURES (float32)
+
+    Raises:
+        ValueError: If the signal is too short for delta features
+    """
+    y = np.ascontiguousarray(y, dtype=np.float32)
+
+    n_frames = 1 + len(y) // HOP_LENGTH
+    if n_frames < DELTA_WIDTH:
+        raise ValueError(
+            f"Audio too short: {n_frames} frames, need at least {DELTA_WIDTH}"
+        )
+
+    bases = feature_bases(sr)
+
+    # Centred STFT with zero padding (librosa.stft defaults)
+    y_padded = np.pad(y, N_FFT // 2, mode='constant')
+    frames = np.lib.stride_tricks.sliding_window_view(y_padded, N_FFT)
+    frames = frames[::HOP_LENGTH]
+
+    mag = np.abs(np.fft.rfft(frames * bases.window, axis=1))
+
+    log_mel, centroid, rolloff = _spectral_frames(
+        mag, bases.mel_basis, bases.band_lo, bases.band_hi, bases.freqs
+    )
+    mfcc = _mfcc(log_mel, bases.dct_basis)
+    delta_mfcc = _delta(mfcc, 1)
+    delta2_mfcc = _delta(mfcc, 2)
+
+    zcr = _zero_crossing_rate(y)
+
+    return _aggregate(mfcc, delta_mfcc, delta2_mfcc, centroid, rolloff, zcr)
@@ -0,0 +1,259 @@
+"""
+Fast SVM Inference
+==================
+float32 evaluation of a fitted RBF-kernel sklearn SVC.
+
+The kernel matrix against the support vectors is computed with a single
+float32 GEMM, and all one-vs-one decision values come from a second GEMM
+against a pre-arranged coefficient matrix. Class votes and libsvm's
+pairwise-coupling probabilities are then computed in compiled code, so
+predictions match SVC.predict / SVC.predict_proba.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+from numba import njit
+
+
+# libsvm constants for probability estimates
+_MIN_PROB = 1e-7
+
+
+@njit(cache=True, nogil=True)
+def _votes(dec, n_classes):
+    """
+    One-vs-one voting, as in libsvm's svm_predict.
+
+    Args:
+        dec: Decision values, shape (n_samples, n_pairs)
+        n_classes: Number of classes
+
+    Returns:
+        Winning class index per sample (ties go to the lower index)
+    """
+    n_samples = dec.shape[0]
+    winners = np.empty(n_samples, dtype=np.int64)
+    votes = np.empty(n_classes, dtype=np.int64)
+    for s in range(n_samples):
+        votes[:] = 0
+        p = 0
+        for i in range(n_classes):
+            for j in range(i + 1, n_classes):
+                if dec[s, p] > 0:
+                    votes[i] += 1
+                else:
+                    votes[j] += 1
+                p += 1
+        winners[s] = np.argmax(votes)
+    return winners
+
+
+@njit(cache=True, nogil=True)
+def _couple_probabilities(dec, prob_a, prob_b, n_classes):
+    """
+    Platt scaling + pairwise coupling, as in libsvm's
+    svm_predict_probability / multiclass_probability.
+
+    Args:
+        dec: Decision values, shape (n_samples, n_pairs)
+        prob_a: Platt slope per pair
+        prob_b: Platt offset per pair
+        n_classes: Number of classes
+
+    Returns:
+        Class probabilities, shape (n_samples, n_classes)
+    """
+    k = n_classes
+    n_samples = dec.shape[0]
+    out = np.empty((n_samples, k))
+    r = np.empty((k, k))
+    Q = np.empty((k, k))
+    Qp = np.empty(k)
+    p = np.empty(k)
+    max_iter = max(100, k)
+    eps = 0.005 / k
+
+    for s in range(n_samples):
+        # Pairwise probabilities from the sigmoid fit
+        pair = 0
+        for i in range(k):
+            for j in range(i + 1, k):
+                f = dec[s, pair] * prob_a[pair] + prob_b[pair]
+                if f >= 0:
+                    sig = np.exp(-f) / (1.0 + np.exp(-f))
+                else:
+                    sig = 1.0 / (1.0 + np.exp(f))
+                sig = min(max(sig, _MIN_PROB), 1.0 - _MIN_PROB)
+                r[i, j] = sig
+                r[j, i] = 1.0 - sig
+                pair += 1
+
+        for t in range(k):
+            p[t] = 1.0 / k
+            Q[t, t] = 0.0
+            for j in range(t):
+                Q[t, t] += r[j, t] * r[j, t]
+                Q[t, j] = Q[j, t]
+            for j in range(t + 1, k):
+                Q[t, t] += r[j, t] * r[j, t]
+                Q[t, j] = -r[j, t] * r[t, j]
+
+        for _ in range(max_iter):
+            pQp = 0.0
+            for t in range(k):
+                Qp[t] = 0.0
+                for j in range(k):
+                    Qp[t] += Q[t, j] * p[j]
+                pQp += p[t] * Qp[t]
+            max_error = 0.0
+            for t in range(k):
+                max_error = max(max_error, abs(Qp[t] - pQp))
+            if max_error < eps:
+                break
+            for t in range(k):
+                diff = (-Qp[t] + pQp) / Q[t, t]
+                p[t] += diff
+                pQp = (pQp + diff * (diff * Q[t, t] + 2 * Qp[t])) \
+                    / (1 + diff) / (1 + diff)
+                for j in range(k):
+                    Qp[j] = (Qp[j] + diff * Q[t, j]) / (1 + diff)
+                    p[j] /= 1 + diff
+
+        out[s] = p
+    return out
+
+
+class RBFSVC:
+    """
+    float32 inference for a fitted multiclass RBF SVC.
+
+    Attributes:
+        classes_: Class labels, as in the source model
+        has_proba: Whether the source model was fitted with probability=True
+    """
+
+    # Derived arrays that can be saved and memory-mapped (see export_pickle.py)
+    ARRAYS = ('sv_T', 'sv_sq', 'coef')
+
+    def __init__(self, model, arrays=None):
+        """
+        Copy the fitted parameters of an sklearn SVC into float32 arrays.
+
+        Args:
+            model: Fitted sklearn.svm.SVC with kernel='rbf'
+            arrays: Optional mapping of the ARRAYS names to precomputed
+                (e.g. memory-mapped) arrays; skips deriving them from the
+                support vectors
+        """
+        self.classes_ = model.classes_
+        self.gamma = np.float32(model._gamma)
+        self.n_classes = len(model.classes_)
+
+        if arrays is not None:
+            self.sv_T, self.sv_sq, self.coef = (
+                arrays[name] for name in self.ARRAYS
+            )
+        else:
+            self._derive_arrays(model)
+
+        self.intercept = model.intercept_.astype(np.float32)
+
+        self.has_proba = model.probability
+        self.prob_a = model._probA.astype(np.float64)
+        self.prob_b = model._probB.astype(np.float64)
+
+    def _derive_arrays(self, model):
+        """Build sv_T, sv_sq and coef from the model's support vectors."""
+        sv = model.support_vectors_.astype(np.float32)
+        self.sv_T = np.ascontiguousarray(sv.T)
+        self.sv_sq = np.einsum('ij,ij->i', sv, sv)
+
+        # Arrange dual coefficients so one GEMM yields every pair's
+        # decision value: column p only weights SVs of classes i and j
+        starts = np.concatenate([[0], np.cumsum(model.n_support_)])
+        n_pairs = self.n_classes * (self.n_classes - 1) // 2
+        coef = np.zeros((len(sv), n_pairs), dtype=np.float32)
+        p = 0
+        for i in range(self.n_classes):
+            for j in range(i + 1, self.n_classes):
+                sv_i = slice(starts[i], starts[i + 1])
+                sv_j = slice(starts[j], starts[j + 1])
+                coef[sv_i, p] = model.dual_coef_[j - 1, sv_i]
+                coef[sv_j, p] = model.dual_coef_[i, sv_j]
+                p += 1
+        self.coef = coef
+
+    @classmethod
+    def from_model(cls, model, arrays=None) -> Optional['RBFSVC']:
+        """
+        Build the fast path if the model is a supported SVC.
+
+        Args:
+            model: Any fitted sklearn classifier
+            arrays: Optional precomputed ARRAYS (see __init__)
+
+        Returns:
+            RBFSVC, or None for other models (including binary SVCs,
+            whose decision sign convention differs, SVCs with
+            break_ties=True, which predict by one-vs-rest argmax instead
+            of voting, and SVCs fitted on sparse input)
+        """
+        if (
+            type(model).__name__ != 'SVC'
+            or model.kernel != 'rbf'
+            or len(model.classes_) < 3
+            or getattr(model, 'break_ties', False)
+            or getattr(model, '_sparse', False)
+        ):
+            return None
+        return cls(model, arrays)
+
+    def decision_function(self, X: np.ndarray) -> np.ndarray:
+        """
+        One-vs-one decision values (decision_function_shape='ovo').
+
+        Args:
+            X: Scaled features, shape (n_samples, n_features)
+
+        Returns:
+            Decision values, shape (n_samples, n_pairs), float32
+        """
+        X = np.asarray(X, dtype=np.float32)
+
+        # ||x - sv||^2 = ||x||^2 + ||sv||^2 - 2 x.sv, all in float32
+        sq_dist = X @ self.sv_T
+        sq_dist *= -2.0
+        sq_dist += np.einsum('ij,ij->i', X, X)[:, None]
+        sq_dist += self.sv_sq
+        np.maximum(sq_dist, 0.0, out=sq_dist)
+
+        sq_dist *= -self.gamma
+        K = np.exp(sq_dist, out=sq_dist)
+
+        dec = K @ self.coef
+        dec += self.intercept
+        return dec
+
+    def predict_with_proba(
+        self,
+        X: np.ndarray
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Predicted labels and (if available) class probabilities.
+
+        Args:
+            X: Scaled features, shape (n_samples, n_features)
+
+        Returns:
+            Tuple (labels, probs); probs is ordered as classes_ and None if
+            the model was fitted without probability=True
+        """
+        dec = self.decision_function(X)
+        labels = self.classes_[_votes(dec, self.n_classes)]
+        probs = None
+        if self.has_proba:
+            probs = _couple_probabilities(
+                dec, self.prob_a, self.prob_b, self.n_classes
+            )
+        return labels, probs
@@ -9,10 +9,12 @@ Requirements:
 
 import numpy as np
 import sounddevice as sd
-import librosa
 from emotion_predictor import EmotionPredictor
 import time
 import sys
+import queue
+import atexit
+import threading
 from collections import deque
 
 
@@ -23,7 +25,8 @@ class LiveEmotionDetector:
     
     def __init__(self, model_path='artifacts/svm_model.pkl',
                  scaler_path='artifacts/standard_scaler.pkl',
-                 duration=3, sample_rate=22050):
+                 duration=3, sample_rate=22050,
+                 smoothing_window=3, stay_prob=0.8):
         """
         Initialize the live detector.
         
@@ -32,43 +35,117 @@ class LiveEmotionDetector:
             scaler_path: Path to fitted scaler
             duration: Audio duration to analyze (seconds)
             sample_rate: Audio sampling rate (Hz)
+            smoothing_window: Number of recent clips used for smoothing
+            stay_prob: Prior probability that the emotion carries over
+                from one clip to the next
         """
         self.predictor = EmotionPredictor(model_path, scaler_path)
         self.duration = duration
         self.sample_rate = sample_rate
         self.is_recording = False
         
-        # Keep track of recent predictions for smoothing
-        self.history = deque(maxlen=3)
+        # Keep track of recent predictions (log-probabilities) for smoothing
+        self.history = deque(maxlen=smoothing_window)
+        
+        # HMM transition prior over emotions, in model class order
+        self.class_names = [
+            self.predictor.emotion_map[c] for c in self.predictor.model.classes_
+        ]
+        n_classes = len(self.class_names)
+        trans = np.full(
+            (n_classes, n_classes), (1 - stay_prob) / (n_classes - 1)
+        )
+        np.fill_diagonal(trans, stay_prob)
+        self.log_trans = np.log(trans)
+        
+        # Persistent microphone stream writing into a ring buffer; each
+        # recording slices fresh samples out instead of reopening PortAudio
+        ring_seconds = max(10, 2 * duration)
+        self._ring = np.zeros(int(ring_seconds * sample_rate), dtype=np.float32)
+        self._written = 0
+        self._read_pos = None
+        self._ring_cond = threading.Condition()
+        self._stream = sd.InputStream(
+            samplerate=sample_rate,
+            channels=1,
+            dtype='float32',
+            blocksize=1024,
+            callback=self._audio_callback
+        )
+        self._stream.start()
+        atexit.register(self.close)
         
         print("🎤 Live Emotion Detector Initialized")
         print(f"   Duration: {duration}s | Sample Rate: {sample_rate}Hz")
         print("=" * 70)
     
-    def record_audio(self):
+    def record_audio(self, quiet=False):
         """
         Record audio from microphone.
         
+        Returns the next ``duration`` seconds captured by the persistent
+        input stream. Consecutive calls continue where the previous clip
+        ended, so back-to-back recordings tile the stream without gaps;
+        the first call (or one that fell a full ring behind) starts at
+        the newest sample.
+        
+        Args:
+            quiet: Skip the status line (set by the background recorder,
+                whose output would interleave with the results)
+        
         Returns:
             Audio data as numpy array
         """
-        print(f"\n🔴 Recording {self.duration} seconds...")
-        sys.stdout.flush()
+        if not quiet:
+            print(f"\n🔴 Recording {self.duration} seconds...")
+            sys.stdout.flush()
         
-        # Record audio
-        audio = sd.rec(
-            int(self.duration * self.sample_rate),
-            samplerate=self.sample_rate,
-            channels=1,
-            dtype='float32'
-        )
-        sd.wait()  # Wait until recording is finished
+        n_samples = int(self.duration * self.sample_rate)
         
-        # Convert to 1D array
-        audio = audio.flatten()
+        # Wait for the stream to deliver the n_samples after the cursor
+        with self._ring_cond:
+            start = self._read_pos
+            if start is None or self._written - start > len(self._ring):
+                start = self._written
+            received = self._ring_cond.wait_for(
+                lambda: self._written >= start + n_samples,
+                timeout=self.duration + 2
+            )
+            if not received:
+                raise RuntimeError("No audio received from microphone")
+            
+            pos = start % len(self._ring)
+            end = pos + n_samples
+            if end <= len(self._ring):
+                audio = self._ring[pos:end].copy()
+            else:
+                audio = np.concatenate(
+                    [self._ring[pos:], self._ring[:end - len(self._ring)]]
+                )
+            self._read_pos = start + n_samples
         
         return audio
     
+    def _audio_callback(self, indata, frames, time_info, status):
+        """
+        PortAudio callback: append the new block to the ring buffer.
+        """
+        ring_len = len(self._ring)
+        with self._ring_cond:
+            pos = self._written % ring_len
+            first = min(frames, ring_len - pos)
+            self._ring[pos:pos + first] = indata[:first, 0]
+            self._ring[:frames - first] = indata[first:, 0]
+            self._written += frames
+            self._ring_cond.notify_all()
+    
+    def close(self):
+        """Stop and close the microphone stream."""
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+    
     def extract_features_from_audio(self, audio):
         """
         Extract features from audio array.
@@ -83,45 +160,10 @@ class LiveEmotionDetector:
         if len(audio) > self.duration * self.sample_rate:
             audio = audio[:int(self.duration * self.sample_rate)]
         
-        # MFCCs
-        mfcc = librosa.feature.mfcc(y=audio, sr=self.sample_rate, n_mfcc=13)
-        
-        # Delta & Delta-Delta
-        delta_mfcc = librosa.feature.delta(mfcc)
-        delta2_mfcc = librosa.feature.delta(mfcc, order=2)
-        
-        # Temporal aggregation
-        mfcc_mean = np.mean(mfcc, axis=1)
-        mfcc_std = np.std(mfcc, axis=1)
-        
-        delta_mean = np.mean(delta_mfcc, axis=1)
-        delta_std = np.std(delta_mfcc, axis=1)
-        
-        delta2_mean = np.mean(delta2_mfcc, axis=1)
-        delta2_std = np.std(delta2_mfcc, axis=1)
-        
-        # Spectral features
-        spectral_centroid = np.mean(
-            librosa.feature.spectral_centroid(y=audio, sr=self.sample_rate)
-        )
-        spectral_rolloff = np.mean(
-            librosa.feature.spectral_rolloff(y=audio, sr=self.sample_rate)
+        # Same extraction (and feature-count handling) as file prediction
+        return self.predictor.extract_features_from_array(
+            audio, self.sample_rate
         )
-        zero_crossing_rate = np.mean(
-            librosa.feature.zero_crossing_rate(audio)
-        )
-        
-        # Combine all features
-        features = np.hstack([
-            mfcc_mean, mfcc_std,
-            delta_mean, delta_std,
-            delta2_mean, delta2_std,
-            spectral_centroid,
-            spectral_rolloff,
-            zero_crossing_rate
-        ])
-        
-        return features
     
     def predict_from_audio(self, audio):
         """
@@ -133,33 +175,39 @@ class LiveEmotionDetector:
         Returns:
             Tuple of (emotion, confidence, probabilities)
         """
-        # Extract features
+        # Extract features and predict with the file pipeline's code path
         features = self.extract_features_from_audio(audio)
-        features = features.reshape(1, -1)
+        return self.predictor.predict_from_features(features)
+    
+    def smooth_prediction(self, probabilities):
+        """
+        Temporally smoothed emotion via Viterbi over recent clips.
         
-        # Normalize and predict
-        features_scaled = self.predictor.scaler.transform(features)
+        The classifier probabilities of the last clips act as emissions of
+        an HMM whose transition prior favours staying in the same emotion;
+        the most likely current state of the best path is returned.
         
-        emotion_id = self.predictor.model.predict(features_scaled)[0]
-        emotion_label = self.predictor.emotion_map[emotion_id]
+        Args:
+            probabilities: Emotion probabilities of the newest clip
+            
+        Returns:
+            Smoothed emotion label, or None without probabilities
+        """
+        if not probabilities:
+            return None
         
-        # Get probabilities
-        probabilities = {}
-        confidence = None
+        emit = np.array([probabilities[name] for name in self.class_names])
+        self.history.append(np.log(np.maximum(emit, 1e-12)))
         
-        if hasattr(self.predictor.model, 'predict_proba'):
-            probs = self.predictor.model.predict_proba(features_scaled)[0]
-            
-            for idx, prob in enumerate(probs):
-                emotion_id_mapped = self.predictor.model.classes_[idx]
-                emotion_name = self.predictor.emotion_map[emotion_id_mapped]
-                probabilities[emotion_name] = prob
-            
-            confidence = probabilities[emotion_label]
+        log_emit = np.array(self.history)
+        V = log_emit[0]
+        for t in range(1, len(log_emit)):
+            V = log_emit[t] + np.max(V[:, None] + self.log_trans, axis=0)
         
-        return emotion_label, confidence, probabilities
+        return self.class_names[int(np.argmax(V))]
     
-    def display_result(self, emotion, confidence, probabilities, iteration):
+    def display_result(self, emotion, confidence, probabilities, iteration,
+                       smoothed=None):
         """
         Display prediction result in a nice format.
         """
@@ -167,6 +215,9 @@ class LiveEmotionDetector:
         print(f"📊 Analysis #{iteration}")
         print("=" * 70)
         print(f"🎯 Detected Emotion: {emotion}")
+        if smoothed is not None:
+            print(f"🧭 Smoothed Emotion: {smoothed} "
+                  f"(last {len(self.history)} recordings)")
         
         if confidence:
             print(f"📈 Confidence: {confidence:.1%}")
@@ -210,19 +261,31 @@ class LiveEmotionDetector:
         print("=" * 70)
         print("\nInstructions:")
         print("  • Speak naturally into your microphone")
-        print("  • Each recording is 3 seconds")
+        print(f"  • Each recording is {self.duration} seconds")
         print("  • Press Ctrl+C to stop")
         print("\nStarting in 3 seconds...")
         time.sleep(3)
         
         iteration = 0
         
+        # Record the next clip in the background while this one is analyzed
+        audio_queue = queue.Queue(maxsize=2)
+        stop_event = threading.Event()
+        recorder = threading.Thread(
+            target=self._record_loop,
+            args=(audio_queue, stop_event),
+            daemon=True
+        )
+        recorder.start()
+        print(f"\n🔴 Recording continuously ({self.duration}s clips)...")
+        
         try:
             while True:
-                iteration += 1
+                audio = audio_queue.get()
+                if isinstance(audio, Exception):
+                    raise audio
                 
-                # Record audio
-                audio = self.record_audio()
+                iteration += 1
                 
                 # Check if audio has sufficient volume
                 if np.max(np.abs(audio)) < 0.01:
@@ -231,17 +294,40 @@ class LiveEmotionDetector:
                 
                 # Predict emotion
                 emotion, confidence, probabilities = self.predict_from_audio(audio)
+                smoothed = self.smooth_prediction(probabilities)
                 
                 # Display result
-                self.display_result(emotion, confidence, probabilities, iteration)
-                
-                # Small pause before next recording
-                print("\n⏸️  Pausing 2 seconds before next recording...")
-                time.sleep(2)
+                self.display_result(
+                    emotion, confidence, probabilities, iteration, smoothed
+                )
                 
         except KeyboardInterrupt:
             print("\n\n🛑 Stopping live detection...")
             print("👋 Goodbye!")
+        finally:
+            stop_event.set()
+            recorder.join(timeout=self.duration + 1)
+    
+    def _record_loop(self, audio_queue, stop_event):
+        """
+        Producer for run_continuous: record clips back to back.
+        
+        Args:
+            audio_queue: Queue receiving recorded clips (or the exception
+                that stopped recording)
+            stop_event: Event signalling the loop to exit
+        """
+        try:
+            while not stop_event.is_set():
+                audio = self.record_audio(quiet=True)
+                while not stop_event.is_set():
+                    try:
+                        audio_queue.put(audio, timeout=0.5)
+                        break
+                    except queue.Full:
+                        continue
+        except Exception as e:
+            audio_queue.put(e)
     
     def run_single(self):
         """